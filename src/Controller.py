@@ -10,6 +10,7 @@ Description: Implements the Controller class, which manages the front end logic
 and main process loop of the DeviceSerialCapture program.
 """
 # Library Imports.
+from collections import deque
 from PyQt5.QtCore import QThread, QTimer, QMutex
 from serial import Serial
 import serial.tools.list_ports
@@ -31,12 +32,13 @@ class Controller:
         self.data_controller = {
             # Reference to self for serial worker management.
             "app": self,
-            # The current status of the application. One of two states:
+            # The current status of the application. One of three states:
             # - DISCONNECTED
+            # - CONNECTING
             # - CONNECTED
             "status": "DISCONNECTED",
-            # The current list of available ports to connect to.
-            "port_names": [],
+            # The current tuple of available ports to connect to.
+            "port_names": (),
             # The current listed port configuration to connect to.
             "config": {
                 "port_name": "",
@@ -54,9 +56,9 @@ class Controller:
             "serial_thread": None,
             # The shared serial datastream for reading and writing messages.
             "serial_datastream": {
-                "read": [],
+                "read": deque(),
                 "read_lock": QMutex(),
-                "write": [],
+                "write": deque(),
                 "write_lock": QMutex(),
                 "status": [],
                 "status_lock": QMutex(),
@@ -210,7 +212,6 @@ class Controller:
                 self._close_serial("Serial EOPEN: " + str(e))
 
             # Poll the serial connection until exit.
-            _read_buffer = self._serial_datastream["read"]
             _read_lock = self._serial_datastream["read_lock"]
             _write_buffer = self._serial_datastream["write"]
             _write_lock = self._serial_datastream["write_lock"]
@@ -218,33 +219,41 @@ class Controller:
             while self._serial_connection.isOpen() and self._enabled:
                 try:
                     # While alive, any received packets are captured and dumped into
-                    # serial_datastream["read"].
-                    response = self._serial_connection.read(500)
-                    while not _read_lock.tryLock(50):
-                        pass
-                    if response != b"":
+                    # serial_datastream["read"]. Everything already waiting in
+                    # the input buffer is read in one call, and each read is
+                    # queued as a single bytes chunk.
+                    response = self._serial_connection.read(
+                        max(500, self._serial_connection.in_waiting)
+                    )
+                    if response:
                         # print("Read({}): {}".format(id, response.decode("utf-8")))
-                        _read_buffer.append(response)
-                    _read_lock.unlock()
+                        # The consumer swaps the read FIFO out, so look it up
+                        # each time rather than holding on to a reference.
+                        _read_lock.lock()
+                        try:
+                            self._serial_datastream["read"].append(response)
+                        finally:
+                            _read_lock.unlock()
 
                     # While alive, any packets in serial_datastream["write"] are
                     # sent.
                     if _write_buffer:
-                        # To reduce lock time, capture first read in write array only.
-                        write_set_len = len(_write_buffer)
-                        write_set = _write_buffer[0:write_set_len]
+                        # To reduce lock time, drain the write FIFO in one batch
+                        # and send the entries after releasing the lock.
+                        write_set = []
+                        _write_lock.lock()
+                        try:
+                            while _write_buffer:
+                                write_set.append(_write_buffer.popleft())
+                        finally:
+                            _write_lock.unlock()
+
                         # print("Write({}): {}".format(id, str(write_set)))
                         try:
                             for entry in write_set:
                                 self._serial_connection.write(entry)
                         except Exception as e:
-                            _update_status("Serial Write: " + str(e))
-
-                        # Clear out what we have read.
-                        while not _write_lock.tryLock(50):
-                            pass
-                        _write_buffer = _write_buffer[write_set_len:]
-                        _write_lock.unlock()
+                            self._update_status("Serial Write: " + str(e))
 
                     id += 1
                 except Exception as e:
@@ -261,10 +270,11 @@ class Controller:
             msg : Str
                 Message to pass to the serial datastream.
             """
-            while not self._serial_datastream["status_lock"].tryLock(50):
-                pass
-            self._serial_datastream["status"].append(msg)
-            self._serial_datastream["status_lock"].unlock()
+            self._serial_datastream["status_lock"].lock()
+            try:
+                self._serial_datastream["status"].append(msg)
+            finally:
+                self._serial_datastream["status_lock"].unlock()
 
         def _close_serial(self, msg):
             """
@@ -114,6 +114,9 @@ class Graph(View):
         # Reference to the graph for easy modification.
         self._graph = {}
 
+        # Series with points added since the last redraw.
+        self._dirty = set()
+
         self.updateUI()
 
     def addPoint(self, series, datapointX, datapointY):
@@ -139,11 +142,7 @@ class Graph(View):
             self._series[series]["data"]["y"].append(
                 datapointY * self._series[series]["multiplier"]
             )
-
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+            self._dirty.add(series)
 
     def addPoints(self, series, datapointsX, datapointsY):
         """
@@ -165,15 +164,27 @@ class Graph(View):
         Datapoints are inserted IN ORDER. We aren't doing any sorting for you.
         """
         if series in self._series:
-            self._series[series]["data"]["x"] += datapointsX
+            data = self._series[series]["data"]
+            data["x"].extend(datapointsX)
             modifier = self._series[series]["multiplier"]
-            modifiedDatapointsY = [datapointY * modifier for datapointY in datapointsY]
-            self._series[series]["data"]["y"] += modifiedDatapointsY
+            if modifier == 1:
+                data["y"].extend(datapointsY)
+            else:
+                data["y"].extend(datapointY * modifier for datapointY in datapointsY)
+            self._dirty.add(series)
 
+    def flush(self):
+        """
+        Redraws the series that have had points added since the last redraw.
+        Points added with addPoint(s) aren't drawn until this is called, so a
+        batch of points is drawn once.
+        """
+        for series in self._dirty:
             self._graph[series].setData(
                 x=self._series[series]["data"]["x"],
                 y=self._series[series]["data"]["y"],
             )
+        self._dirty.clear()
 
     def addSeries(self, series, seriesDict):
         """
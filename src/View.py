@@ -33,6 +33,9 @@ class View:
     BLUE = QColor(0, 0, 255, 255)
     RED = QColor(255, 0, 0, 255)
     GREEN = QColor(0, 255, 0, 255)
+    GRAY = QColor(122, 122, 122, 255)
+    LIGHT_BLUE = QColor(122, 122, 255, 255)
+    LIGHT_GREEN = QColor(122, 255, 122, 255)
 
     # Timing constants.
     SECOND = 1000  # in milliseconds.
@@ -90,7 +93,7 @@ class View:
         if function is not None:
             self._frame_timer = QTimer()
             self._frame_timer.timeout.connect(function)
-            self._frame_timer.start(View.SECOND / self._framerate)
+            self._frame_timer.start(View.SECOND // self._framerate)
 
     def stop_frame(self):
         """
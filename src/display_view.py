@@ -10,6 +10,7 @@ Description: Implements the child DisplayView class for tabs in the Controller.
 """
 # Library Imports.
 from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QPalette
 
 # Custom Imports.
 from src.view import View
@@ -23,6 +24,9 @@ class DisplayView(View):
     - data controller access
     """
 
+    # Status label palettes, cached by the RGBA value of their background.
+    _status_palettes = {}
+
     def __init__(self, controller=None, framerate=30):
         """
         Upon initialization, we perform any data and UI setup required to get
@@ -42,26 +46,47 @@ class DisplayView(View):
         # References to UI elements generated from the controller.
         self._widget_pointers = controller.get_data_pointer("widget_pointers")
 
-    def raise_status(self, status_str, status_color_str):
+        # The status label background is set through its palette instead of a
+        # style sheet, so status changes don't go through the CSS parser.
+        self._lbl_status = self._widget_pointers["lbl_status"]
+        self._lbl_status.setAutoFillBackground(True)
+
+        # Single shot timer for reverting temporary statuses. Restarting it on
+        # each temporary status keeps at most one revert pending.
+        self._revert_timer = QTimer()
+        self._revert_timer.setSingleShot(True)
+        self._revert_timer.timeout.connect(self.revert_temp_status)
+
+    def raise_status(self, status_str, status_color):
         """
         Raises a status message indefinitely.
+
+        Parameters
+        ----------
+        status_str: str
+            Status string to display.
+        status_color: QColor
+            Background color of the status label.
         """
-        self._widget_pointers["lbl_status"].setText(status_str)
-        self._widget_pointers["lbl_status"].setStyleSheet(
-            "QLabel { background-color: " + status_color_str + "; }"
-        )
+        self._lbl_status.setText(status_str)
+        self._set_status_color(status_color)
 
-    def raise_temp_status(self, status_str, status_color_str):
+    def raise_temp_status(self, status_str, status_color):
         """
         Raises a status message on the status label for 10 seconds.
+
+        Parameters
+        ----------
+        status_str: str
+            Status string to display.
+        status_color: QColor
+            Background color of the status label.
         """
-        self._widget_pointers["lbl_status"].setText(status_str)
-        self._widget_pointers["lbl_status"].setStyleSheet(
-            "QLabel { background-color: " + status_color_str + "; }"
-        )
+        self._lbl_status.setText(status_str)
+        self._set_status_color(status_color)
 
         # Set timer to set status back to OK.
-        QTimer.singleShot(10000, self.revert_temp_status)
+        self._revert_timer.start(10 * DisplayView.SECOND)
 
     def raise_error(self, error_str):
         """
@@ -72,7 +97,7 @@ class DisplayView(View):
         error_str: str
             Error string to display.
         """
-        self.raise_temp_status(error_str, "rgba(255, 0, 0, 255)")
+        self.raise_temp_status(error_str, DisplayView.RED)
 
     def revert_temp_status(self):
         """
@@ -80,12 +105,26 @@ class DisplayView(View):
         time.
         """
         status = self._controller.get_data_pointer("status")
-        self._widget_pointers["lbl_status"].setText(status)
+        self._lbl_status.setText(status)
         if status == "DISCONNECTED":
-            self._widget_pointers["lbl_status"].setStyleSheet(
-                "QLabel { background-color: rgba(122, 122, 122, 255); }"
-            )
+            self._set_status_color(DisplayView.GRAY)
         elif status == "CONNECTED":
-            self._widget_pointers["lbl_status"].setStyleSheet(
-                "QLabel { background-color: rgba(122, 255, 122, 255); }"
-            )
+            self._set_status_color(DisplayView.LIGHT_GREEN)
+        elif status == "CONNECTING":
+            self._set_status_color(DisplayView.LIGHT_BLUE)
+
+    def _set_status_color(self, status_color):
+        """
+        Sets the background color of the status label.
+
+        Parameters
+        ----------
+        status_color: QColor
+            Background color of the status label.
+        """
+        palette = DisplayView._status_palettes.get(status_color.rgba())
+        if palette is None:
+            palette = QPalette(self._lbl_status.palette())
+            palette.setColor(QPalette.Window, status_color)
+            DisplayView._status_palettes[status_color.rgba()] = palette
+        self._lbl_status.setPalette(palette)
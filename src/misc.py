@@ -9,9 +9,16 @@ Last Modified: 05/21/21
 Description: Contains miscellaneous, shared functions.
 """
 # Library Imports.
+import json
 from serial import Serial
 import serial.tools.list_ports
 
+# orjson is an optional, faster JSON parser. Fall back to json without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Function Definitions.
 def capture_port_names():
     """
@@ -19,7 +26,29 @@ def capture_port_names():
 
     Returns
     -------
-    [str]
-        List of ports currently active.
+    (str)
+        Tuple of ports currently active.
+    """
+    return tuple(
+        port for port, desc, hwid in sorted(serial.tools.list_ports.comports())
+    )
+
+
+def load_json_file(file_name):
+    """
+    Loads and parses a JSON file.
+
+    Parameters
+    ----------
+    file_name : Str
+        Path to the JSON file.
+
+    Returns
+    -------
+    Any
+        The parsed JSON data.
     """
-    return [port for port, desc, hwid in sorted(serial.tools.list_ports.comports())]
+    with open(file_name, "rb") as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
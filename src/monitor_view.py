@@ -9,17 +9,41 @@ Last Modified: 05/21/21
 Description: Implements the MonitorView class, which inherits DisplayView class.
 """
 # Library Imports.
-import json
-from PyQt5.QtCore import QDir
-from PyQt5.QtGui import QTextCursor
+from collections import deque
+from copy import deepcopy
+import os
+from PyQt5.QtCore import QDir, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont, QTextCharFormat, QTextCursor
 from PyQt5.QtWidgets import QFileDialog
 
 # Custom Imports.
 from src.display_view import DisplayView
 from src.graph import Graph
+from src.misc import load_json_file
 from src.packet_manager import PacketManager
 from src.packet_parser import PacketParser
 
+
+def _console_format(color):
+    """
+    Builds the character format for a colored line in the serial output.
+
+    Parameters
+    ----------
+    color : QColor
+        Color of the text.
+
+    Returns
+    -------
+    QTextCharFormat
+        Small, light weight text in the given color.
+    """
+    text_format = QTextCharFormat()
+    text_format.setForeground(color)
+    text_format.setFontPointSize(8)
+    text_format.setFontWeight(QFont.Light)
+    return text_format
+
 # Class Implementation.
 class MonitorView(DisplayView):
     """
@@ -27,18 +51,57 @@ class MonitorView(DisplayView):
     output and graphs for specific packet configurations.
     """
 
-    SPAN_RED = [
-        '<span style=" font-size:8pt; font-weight:300; color:#ff0000;" >',
-        "</span>",
-    ]
-    SPAN_GREEN = [
-        '<span style=" font-size:8pt; font-weight:300; color:#00ff00;" >',
-        "</span>",
-    ]
-    SPAN_BLUE = [
-        '<span style=" font-size:8pt; font-weight:300; color:#0000ff;" >',
-        "</span>",
-    ]
+    # Character formats for lines in the serial output.
+    FORMAT_DEFAULT = QTextCharFormat()
+    FORMAT_RED = _console_format(DisplayView.RED)
+    FORMAT_GREEN = _console_format(DisplayView.GREEN)
+    FORMAT_BLUE = _console_format(DisplayView.BLUE)
+
+    # Fixed console lines for failed sends.
+    LINE_NOT_CONNECTED = ("Device is not connected.", FORMAT_RED)
+    LINE_NOTHING_TO_SEND = ("There is nothing to send!", FORMAT_RED)
+
+    # Status messages shown in green. Any other status is treated as an error.
+    GREEN_STATUSES = frozenset({"Serial connection was closed.", "READY"})
+
+    # Name of the single series plotted on each packet graph.
+    PACKET_DATA = "packetData"
+
+    # Maximum number of lines kept in the serial output before the oldest are
+    # discarded.
+    MAX_CONSOLE_BLOCKS = 5000
+
+    # Maximum number of bytes parsed per frame. Anything beyond this is parsed
+    # on the next pass of the event loop so large bursts don't stall the UI.
+    PARSE_BUDGET = 64 * 1024
+
+    # Maximum size in bytes of a queued write that new sends are merged into.
+    WRITE_COALESCE_LIMIT = 4096
+
+    # Mandatory list fields in the packet_format, and the type of their
+    # elements, for each packet type.
+    REQUIRED_FIELDS = {
+        0: (("packet_delimiters", str), ("packet_ids", str)),
+        1: (("packet_delimiters", str), ("packet_ids", str), ("specifiers", str)),
+        2: (("header_order", str), ("header_len", int), ("packet_ids", str)),
+        3: (("header_order", str), ("header_len", int), ("packet_ids", str)),
+    }
+
+    # Optional string list fields in the packet_format for each packet type.
+    # These are reported and set to an empty list if missing or invalid.
+    OPTIONAL_FIELDS = {
+        0: ("data_delimiters", "ignore"),
+        1: ("data_delimiters",),
+        2: (),
+        3: (),
+    }
+
+    # Optional string fields of each graph definition and their defaults.
+    GRAPH_DEFAULTS = (
+        ("title", "Unconfigured"),
+        ("x_axis", "Packet Idx"),
+        ("y_axis", "Unconfigured"),
+    )
 
     # Pre-filled dropdown options.
     def __init__(self, controller, framerate):
@@ -57,14 +120,26 @@ class MonitorView(DisplayView):
 
         self._serial_datastream = self._controller.get_data_pointer("serial_datastream")
 
+        # Widgets used by the monitor view.
+        self._te_output = self._widget_pointers["te_serial_output"]
+        self._le_transmit = self._widget_pointers["le_transmit_txt"]
+        self._bu_send = self._widget_pointers["bu_send"]
+        self._bu_save = self._widget_pointers["bu_save"]
+        self._le_packet_config = self._widget_pointers["le_packet_config"]
+        self._tab_visualizer = self._widget_pointers["tab_packet_visualizer"]
+
+        # Bound the serial output so long captures don't grow it without limit.
+        self._te_output.setMaximumBlockCount(MonitorView.MAX_CONSOLE_BLOCKS)
+
+        # Cursor used to append to the serial output, reused across frames.
+        self._console_cursor = QTextCursor(self._te_output.document())
+
         # Setup transmission textbox and send button.
-        self._widget_pointers["le_transmit_txt"].returnPressed.connect(
-            self._send_packet
-        )
-        self._widget_pointers["bu_send"].clicked.connect(self._send_packet)
+        self._le_transmit.returnPressed.connect(self._send_packet)
+        self._bu_send.clicked.connect(self._send_packet)
 
         # Setup save button.
-        self._widget_pointers["bu_save"].clicked.connect(self._save_packets)
+        self._bu_save.clicked.connect(self._save_packets)
 
         # Setup packet file configuration.
         self._widget_pointers["bu_packet_config_filesearch"].clicked.connect(
@@ -78,62 +153,193 @@ class MonitorView(DisplayView):
         # Dict referring to graphs in the monitor view.
         self.graphs = {}
 
+        # Last validated packet configuration, keyed by its file path and
+        # modification time.
+        self._last_config = (None, None)
+
+        # Background save of the packet series, if one is running.
+        self._save_worker = None
+
+        # Bytes read from the serial datastream that have yet to be parsed.
+        self._bytes_to_parse = bytearray()
+
+        # Whether a pass to parse the remaining bytes is already scheduled.
+        self._drain_pending = False
+
+        # Packet delimiters of the active config, as bytes. Parse budgets are
+        # cut after one of these so a packet is never split across passes.
+        self._packet_delims = ()
+
         self.init_frame(self._update_console)
 
     def _update_console(self):
         """
         Performs any required actions at FPS.
         """
-        # Capture read data from serial_datastream, if available.
-        bytes_to_parse = b""
-        while not self._serial_datastream["read_lock"].tryLock(50):
-            pass
-        for byte in self._serial_datastream["read"]:
-            bytes_to_parse += bytearray(byte)
-        self._serial_datastream["read"].clear()
-        self._serial_datastream["read_lock"].unlock()
+        # Capture read data from serial_datastream, if available. The FIFOs are
+        # checked for entries without locking; anything added after the check
+        # is picked up on the next frame.
+        if (
+            not self._bytes_to_parse
+            and not self._serial_datastream["read"]
+            and not self._serial_datastream["status"]
+        ):
+            # Nothing to do this frame.
+            return
 
-        if len(bytes_to_parse) > 0:
-            # Parse any packets if we can.
-            packets_parsed = self._parse_packet(bytes_to_parse)
+        if self._serial_datastream["read"]:
+            # Swap in an empty FIFO under the lock and join the chunks after
+            # releasing it, so the serial thread is only blocked for the swap.
+            self._serial_datastream["read_lock"].lock()
+            try:
+                chunks = self._serial_datastream["read"]
+                self._serial_datastream["read"] = deque()
+            finally:
+                self._serial_datastream["read_lock"].unlock()
+            for chunk in chunks:
+                self._bytes_to_parse.extend(chunk)
+
+        # Lines to append to the text edit this frame.
+        lines = []
+
+        if self._bytes_to_parse:
+            # Parse any packets if we can. Only bytes up to the budget are
+            # parsed this frame, through a view so they aren't copied out of
+            # the buffer, and the rest is scheduled for the next pass.
+            cut = self._budget_cut(self._bytes_to_parse)
+            with memoryview(self._bytes_to_parse)[:cut] as view:
+                packets_parsed = self._parse_packet(view)
+            del self._bytes_to_parse[:cut]
+            if self._bytes_to_parse and not self._drain_pending:
+                # Only keep one pass outstanding, so frame ticks don't start
+                # extra chains that together exceed the budget.
+                self._drain_pending = True
+                QTimer.singleShot(0, self._drain_bytes)
 
             # Update the active graphs and the text edit based on packets in
             # the packet_man.
-            for packet in packets_parsed:
-                # Update active graphs.
-                self._apply_data_to_graph(packet)
-
-                # Update the text edit.
-                self._widget_pointers["te_serial_output"].append(packet["text"])
+            self._apply_data_to_graph(packets_parsed)
+            for graph in self.graphs.values():
+                graph.flush()
 
-            self._widget_pointers["te_serial_output"].moveCursor(QTextCursor.End)
+            lines = [
+                (packet["text"], MonitorView.FORMAT_DEFAULT)
+                for packet in packets_parsed
+            ]
 
         # Capture status data from serial_datastream and display on textedit.
-        if not self._serial_datastream["status_lock"].tryLock(50):
-            return
-
         new_status = []
         errors = []
-        for entry in self._serial_datastream["status"]:
-            text = ""
-            if entry == "Serial connection was closed." or entry == "READY":
-                text = MonitorView.SPAN_GREEN[0] + entry + MonitorView.SPAN_GREEN[1]
-                # Capture all closed messages, but keep any READY messages.
-                if entry == "READY":
-                    new_status.append(entry)
-            else:
-                text = MonitorView.SPAN_RED[0] + entry + MonitorView.SPAN_RED[1]
-                errors.append(entry)
-            if text:
-                self._widget_pointers["te_serial_output"].append(text)
-
-        self._serial_datastream["status"] = new_status
-        self._serial_datastream["status_lock"].unlock()
+        if self._serial_datastream["status"]:
+            self._serial_datastream["status_lock"].lock()
+            try:
+                for entry in self._serial_datastream["status"]:
+                    if entry in MonitorView.GREEN_STATUSES:
+                        lines.append((entry, MonitorView.FORMAT_GREEN))
+                        # Capture all closed messages, but keep any READY messages.
+                        if entry == "READY":
+                            new_status.append(entry)
+                    else:
+                        lines.append((entry, MonitorView.FORMAT_RED))
+                        errors.append(entry)
+
+                self._serial_datastream["status"] = new_status
+            finally:
+                self._serial_datastream["status_lock"].unlock()
+
+        if lines:
+            self._append_to_console(lines)
 
         if errors:
             # Raise the first error.
             self.raise_error(errors[0])
 
+    def _drain_bytes(self):
+        """
+        Parses the next budget of bytes left over from a previous pass.
+        """
+        self._drain_pending = False
+        self._update_console()
+
+    def _budget_cut(self, byte_stream):
+        """
+        Finds how many bytes of the byte_stream to parse this pass. With a packet
+        config, the cut is placed right after the last packet delimiter within
+        the budget, since the parser treats a trailing packet with all of its
+        fields as complete and a cut value would be lost. Without one, the cut is
+        moved back to the start of a UTF-8 character, so a multi-byte character
+        is never split across passes.
+
+        Parameters
+        ----------
+        byte_stream : ByteArray
+            Bytes that have yet to be parsed.
+
+        Returns
+        -------
+        Int
+            Number of bytes to parse.
+        """
+        if len(byte_stream) <= MonitorView.PARSE_BUDGET:
+            return len(byte_stream)
+
+        if self._packet_delims:
+            cut = 0
+            for delim in self._packet_delims:
+                pos = byte_stream.rfind(delim, 0, MonitorView.PARSE_BUDGET)
+                if pos >= 0:
+                    cut = max(cut, pos + len(delim))
+
+            # No delimiter within the budget means the whole budget is part of
+            # one packet, so parse everything rather than split it.
+            if cut == 0:
+                return len(byte_stream)
+            return cut
+
+        # Step back over continuation bytes (0b10xxxxxx) to the lead byte.
+        cut = MonitorView.PARSE_BUDGET
+        while cut > 0 and byte_stream[cut] & 0xC0 == 0x80:
+            cut -= 1
+
+        # A budget of nothing but continuation bytes isn't valid UTF-8 either
+        # way, so cut at the budget rather than make no progress.
+        if cut == 0:
+            return MonitorView.PARSE_BUDGET
+        return cut
+
+    def _append_to_console(self, lines):
+        """
+        Appends lines to the serial output text edit. The lines are inserted in
+        a single edit block, so the document is laid out once per batch rather
+        than once per line.
+
+        Parameters
+        ----------
+        lines : [(Str, QTextCharFormat)]
+            Lines of text to append, one block each, and their formats.
+        """
+        # Hold off repaints until the batch is in and scrolled to the end.
+        self._te_output.setUpdatesEnabled(False)
+        try:
+            document = self._te_output.document()
+            cursor = self._console_cursor
+            cursor.movePosition(QTextCursor.End)
+            cursor.beginEditBlock()
+            # Like appendPlainText, an empty document's first block is reused.
+            new_block = not document.isEmpty()
+            for text, text_format in lines:
+                if new_block:
+                    cursor.insertBlock()
+                new_block = True
+                cursor.insertText(text, text_format)
+            cursor.endEditBlock()
+
+            # The cursor is left at the end, so hand it to the widget to scroll
+            # there instead of having the widget move its own cursor.
+            self._te_output.setTextCursor(cursor)
+        finally:
+            self._te_output.setUpdatesEnabled(True)
+
     # Graph management.
     def _add_graph(self, graph_params, graph_ID):
         """
@@ -152,20 +358,19 @@ class MonitorView(DisplayView):
             xAxisLabel=graph_params["x_axis"],
             yAxisLabel=graph_params["y_axis"],
             series={
-                "packetData": {
+                MonitorView.PACKET_DATA: {
                     "data": {"x": [], "y": []},
                     "multiplier": 1,
                     "color": (255, 0, 0),
                 },
-                "list": ("packetData",),
+                # Graph.addSeries appends to this, so each graph gets its own.
+                "list": [MonitorView.PACKET_DATA],
             },
         )
 
         # Add graph widget to the layout.
         widget = self.graphs[graph_ID].get_layout()
-        self._widget_pointers["tab_packet_visualizer"].addTab(
-            widget, graph_params["title"]
-        )
+        self._tab_visualizer.addTab(widget, graph_params["title"])
 
     def _remove_graph(self):
         """
@@ -173,20 +378,46 @@ class MonitorView(DisplayView):
         """
         pass
 
-    def _apply_data_to_graph(self, packet):
+    def _apply_data_to_graph(self, packets):
         """
-        Take a packet and use the config file, if any, to add to the graph.
-        Additionally, adds the packet to a data structure for future saving.
+        Take a batch of packets and use the config file, if any, to add them to
+        the graphs. Points are grouped by series so that each graph is updated
+        once per batch instead of once per packet.
 
         Parameters
         ----------
-        packet : Dict
-            Adds a packet to an active graph.
+        packets : [Dict]
+            Packets to add to the active graphs.
         """
-        if packet["series"] in self.graphs:
-            self.graphs[packet["series"]].addPoint(
-                "packetData", packet["x_val"], float(packet["y_val"])
-            )
+        # Only series with a graph get an entry, so after the first packet of a
+        # series this is a single lookup per packet.
+        graphs = self.graphs
+        points = {}
+        for packet in packets:
+            series = packet["series"]
+            series_points = points.get(series)
+            if series_points is None:
+                if series not in graphs:
+                    continue
+                series_points = points[series] = ([], [])
+            series_points[0].append(packet["x_val"])
+            series_points[1].append(packet["y_val"])
+
+        # Convert each series' y values to floats. If any value isn't numeric,
+        # convert them one at a time instead and drop the points that fail.
+        for series, (xs, ys) in points.items():
+            try:
+                ys = [float(y) for y in ys]
+            except ValueError:
+                numeric_xs, numeric_ys = [], []
+                for x, y in zip(xs, ys):
+                    try:
+                        numeric_ys.append(float(y))
+                    except ValueError:
+                        continue
+                    numeric_xs.append(x)
+                xs, ys = numeric_xs, numeric_ys
+            graphs[series].addPoints(MonitorView.PACKET_DATA, xs, ys)
 
     # Packet management.
     def _get_file_name(self):
@@ -201,15 +432,23 @@ class MonitorView(DisplayView):
 
         if dialog.exec_():
             file_name = dialog.selectedFiles()
-            self._widget_pointers["le_packet_config"].setText(file_name[0])
+            self._le_packet_config.setText(file_name[0])
 
             # File validation. Only checks whether the graph can be constructed.
             if file_name[0].endswith(".json"):
-                with open(file_name[0], "r") as f:
-                    data = json.load(f)
-                    # load into a packet configuration.
-                    self._add_packet_config(data)
-                    f.close()
+                # Reuse the validated config if the file hasn't changed since it
+                # was last loaded.
+                # was last loaded. The cached config is copied in and out so
+                # the copy handed to the program can't change it.
+                key = (file_name[0], os.path.getmtime(file_name[0]))
+                if self._last_config[0] == key:
+                    self._set_packet_config(deepcopy(self._last_config[1]))
+                    return
+
+                data = load_json_file(file_name[0])
+                # load into a packet configuration.
+                if self._add_packet_config(data):
+                    self._last_config = (key, deepcopy(data))
             else:
                 self.raise_error("Invalid file type.")
 
@@ -221,109 +460,82 @@ class MonitorView(DisplayView):
         ----------
         config : Dict
             Configuration generated from the json file.
+
+        Returns
+        -------
+        Bool
+            True if the config was valid and added, False otherwise.
         """
-        # Check for mandatory packet_title.
-        if "packet_title" not in config or type(config["packet_title"]) is not str:
+        # Check for mandatory packet_title. A config that isn't a JSON object
+        # has no title either.
+        if type(config) is not dict or type(config.get("packet_title")) is not str:
             self.raise_error("Invalid config packet title.")
-            return
+            return False
 
         # Check for mandatory packet_format.
-        if "packet_format" not in config or type(config["packet_format"]) is not dict:
+        if type(config.get("packet_format")) is not dict:
             self.raise_error("Invalid packet format.")
-            return
+            return False
 
         # Check fields in packet_format.
         subconfig = config["packet_format"]
+        packet_type = subconfig.get("type")
         if (
-            "type" not in subconfig
-            or type(subconfig["type"]) is not int
-            or subconfig["type"] not in [0, 1, 2, 3]
+            type(packet_type) is not int
+            or packet_type not in MonitorView.REQUIRED_FIELDS
         ):
             self.raise_error("Invalid packet type.")
-            return
+            return False
 
-        if subconfig["type"] == 0:
-            # Check for mandatory packet_delimiters, and packet_ids.
-            if not self._valid_packet_config_helper(
-                subconfig, str, "packet_delimiters", "packet_delimiters"
-            ) or not self._valid_packet_config_helper(
-                subconfig, str, "packet_ids", "packet_ids"
-            ):
-                return
-
-            # Check for optional data_delimiters and ignore strings.
-            if not self._valid_packet_config_helper(
-                subconfig, str, "data_delimiters", "data_delimiters"
-            ):
-                subconfig["data_delimiters"] = []
-
-            if not self._valid_packet_config_helper(subconfig, str, "ignore", "ignore"):
-                subconfig["ignore"] = []
-
-        elif subconfig["type"] == 1:
-            # Check for mandatory packet_delimiters, packet_ids, and specifiers.
-            if (
-                not self._valid_packet_config_helper(
-                    subconfig, str, "packet_delimiters", "packet_delimiters"
-                )
-                or not self._valid_packet_config_helper(
-                    subconfig, str, "packet_ids", "packet_ids"
-                )
-                or not self._valid_packet_config_helper(
-                    subconfig, str, "specifiers", "specifiers"
-                )
-            ):
-                return
-
-            # Check for optional data_delimiters.
-            if not self._valid_packet_config_helper(
-                subconfig, str, "data_delimiters", "data_delimiters"
-            ):
-                subconfig["data_delimiters"] = []
-
-        elif subconfig["type"] == 2 or subconfig["type"] == 3:
-            # Check for mandatory header_order, header_len, and packet_ids.
-            if (
-                not self._valid_packet_config_helper(
-                    subconfig, str, "header_order", "header_order"
-                )
-                or not self._valid_packet_config_helper(
-                    subconfig, int, "header_len", "header_len"
-                )
-                or not self._valid_packet_config_helper(
-                    subconfig, str, "packet_ids", "packet_ids"
-                )
-            ):
-                return
+        # Check for the mandatory fields of the packet type.
+        for key, expected_type in MonitorView.REQUIRED_FIELDS[packet_type]:
+            if not self._valid_packet_config_helper(subconfig, expected_type, key, key):
+                return False
 
-        if (
-            "graph_definitions" in subconfig
-            and type(subconfig["graph_definitions"]) is dict
-        ):
+        # Check for the optional fields of the packet type.
+        for key in MonitorView.OPTIONAL_FIELDS[packet_type]:
+            if not self._valid_packet_config_helper(subconfig, str, key, key):
+                subconfig[key] = []
+
+        self._set_packet_config(config)
+        return True
+
+    def _set_packet_config(self, config):
+        """
+        Sets up the graphs and the packet parser for a validated packet
+        configuration.
+
+        Parameters
+        ----------
+        config : Dict
+            Configuration validated by _add_packet_config.
+        """
+        subconfig = config["packet_format"]
+        if type(subconfig.get("graph_definitions")) is not dict:
+            subconfig["graph_definitions"] = {}
+
+        # Rebuild the graph tabs with updates and signals held off, so the tab
+        # widget lays out once after all of the graphs are added.
+        tabs = self._tab_visualizer
+        tabs.setUpdatesEnabled(False)
+        tabs.blockSignals(True)
+        try:
             # Clear prior graphs from the monitor view.
-            self._widget_pointers["tab_packet_visualizer"].clear()
-            
+            tabs.clear()
+            self.graphs = {}
+
             # Check each entry in graph_definitions.
             for entry in subconfig["packet_ids"]:
                 if entry in subconfig["graph_definitions"]:
                     graph_config = subconfig["graph_definitions"][entry]
-                    if (
-                        "title" not in graph_config
-                        or type(graph_config["title"]) is not str
-                    ):
-                        graph_config["title"] = "Unconfigured"
-                    if (
-                        "x_axis" not in graph_config
-                        or type(graph_config["x_axis"]) is not str
-                    ):
-                        graph_config["x_axis"] = "Packet Idx"
-                    if (
-                        "y_axis" not in graph_config
-                        or type(graph_config["y_axis"]) is not str
-                    ):
-                        graph_config["y_axis"] = "Unconfigured"
-
-                    self._add_graph(subconfig["graph_definitions"][entry], entry)
+                    for key, default in MonitorView.GRAPH_DEFAULTS:
+                        if type(graph_config.get(key)) is not str:
+                            graph_config[key] = default
+
+                    self._add_graph(graph_config, entry)
+        finally:
+            tabs.blockSignals(False)
+            tabs.setUpdatesEnabled(True)
 
         # Passing all mandatory checks, update the packet_config dict with the
         # newest config.
@@ -331,8 +543,13 @@ class MonitorView(DisplayView):
 
         # Then update the packet manager.
         self._packet_parser = PacketParser(config)
+        self._packet_delims = tuple(
+            delim.encode("utf-8")
+            for delim in subconfig.get("packet_delimiters", [])
+            if delim != ""
+        )
 
-    def _valid_packet_config_helper(self, config, type, key, error=None):
+    def _valid_packet_config_helper(self, config, expected_type, key, error=None):
         """
         Validate three things:
         - Whether a given key exists in a presumed dictionary called config
@@ -345,22 +562,26 @@ class MonitorView(DisplayView):
         ----------
         config: Dict
             Dictionary of the packet to check.
-        type: Type
+        expected_type: Type
             Type of value to check in the list.
         key: Str
             Key in the dictionary to check.
         error: None/Str
             Optional error message to display if something should be done.
         """
-        if (
-            key not in config
-            or not isinstance(config[key], list)
-            or any(not isinstance(el, type) for el in config[key])
-        ):
-            if error is not None:
-                self.raise_error("Invalid " + error + ".")
-            return False
-        return True
+        values = config.get(key)
+        if type(values) is list:
+            # Configs come straight from JSON, so element types are exact and
+            # bools are not accepted where ints are expected.
+            for el in values:
+                if type(el) is not expected_type:
+                    break
+            else:
+                return True
+
+        if error is not None:
+            self.raise_error("Invalid " + error + ".")
+        return False
 
     def _parse_packet(self, curr_bytes):
         """
@@ -369,7 +590,7 @@ class MonitorView(DisplayView):
 
         Parameters
         ----------
-        curr_bytes: ByteArray
+        curr_bytes: ByteArray/memoryview
             Bytes that have yet to be parsed.
 
         Returns
@@ -391,51 +612,109 @@ class MonitorView(DisplayView):
         if self._packet_parser:
             self._packet_parser.parse(curr_bytes)
             packets = self._packet_parser.get_packets()
-            for packet in packets:
-                self._packet_man.insert_packet(
-                    packet["series"], packet["x_val"], packet["y_val"]
-                )
+            self._packet_man.insert_packets(packets)
         return packets
 
     def _send_packet(self):
         """
         Pushes data to be written into the serial_datastream.
         """
-        # Check if there is text in the line edit.
-        text = self._widget_pointers["le_transmit_txt"].text()
+        # Grab the text in the line edit and clear it right away.
+        text = self._le_transmit.text()
+        self._le_transmit.clear()
+
         status = self._controller.get_data_pointer("status")
         if text and status == "CONNECTED":
-            # Lock the write FIFO and append to queue, then unlock.
-            while not self._serial_datastream["write_lock"].tryLock(200):
-                pass
-            self._serial_datastream["write"].append(text.encode("utf-8"))
-            self._serial_datastream["write_lock"].unlock()
+            # Build the payload before locking so the lock only covers the FIFO
+            # append.
+            encoded = text.encode("utf-8")
+
+            # Lock the write FIFO and append to queue, then unlock. If the
+            # serial thread hasn't picked up the last entry yet, merge into it
+            # so queued sends go out in fewer writes.
+            write_buffer = self._serial_datastream["write"]
+            self._serial_datastream["write_lock"].lock()
+            try:
+                if (
+                    write_buffer
+                    and len(write_buffer[-1]) + len(encoded)
+                    <= MonitorView.WRITE_COALESCE_LIMIT
+                ):
+                    write_buffer[-1] += encoded
+                else:
+                    write_buffer.append(encoded)
+            finally:
+                self._serial_datastream["write_lock"].unlock()
 
             # Echo to the text edit.
-            text = MonitorView.SPAN_BLUE[0] + text + MonitorView.SPAN_BLUE[1]
-            self._widget_pointers["te_serial_output"].append(text)
+            self._append_to_console([(text, MonitorView.FORMAT_BLUE)])
         # Echo errors to the text edit.
         elif status != "CONNECTED":
-            text = (
-                MonitorView.SPAN_RED[0]
-                + "Device is not connected."
-                + MonitorView.SPAN_RED[1]
-            )
-            self._widget_pointers["te_serial_output"].append(text)
+            self._append_to_console([MonitorView.LINE_NOT_CONNECTED])
         else:
-            text = (
-                MonitorView.SPAN_RED[0]
-                + "There is nothing to send!"
-                + MonitorView.SPAN_RED[1]
-            )
-            self._widget_pointers["te_serial_output"].append(text)
-
-        # Clear the line edit.
-        self._widget_pointers["le_transmit_txt"].clear()
+            self._append_to_console([MonitorView.LINE_NOTHING_TO_SEND])
 
     def _save_packets(self):
         """
-        Saves all possible series in the packet_manager as csv files.
+        Saves all possible series in the packet_manager as csv files. The files
+        are written by a SaveWorker on the global thread pool so the GUI keeps
+        updating, and the save button is disabled until it finishes.
+        """
+        self._bu_save.setEnabled(False)
+
+        self._save_worker = self.SaveWorker(
+            self._packet_man, self._packet_man.get_all_packet_series()
+        )
+        self._save_worker.signals.finished.connect(self._save_packets_finished)
+        QThreadPool.globalInstance().start(self._save_worker)
+
+    def _save_packets_finished(self):
+        """
+        Called on the GUI thread once the SaveWorker has written every series.
+        """
+        self._save_worker = None
+        self._bu_save.setEnabled(True)
+
+    class SaveWorker(QRunnable):
         """
-        for series in self._packet_man.get_all_packet_series():
-            self._packet_man.save_packet_series(series)
+        The SaveWorker class writes a set of packet series to csv files off of
+        the GUI thread. Each series is written to its own file, one after
+        another.
+        """
+
+        class Signals(QObject):
+            """
+            Signals emitted by the SaveWorker. QRunnable is not a QObject, so
+            they are held by this helper instead.
+            """
+
+            finished = pyqtSignal()
+
+        def __init__(self, packet_man, packet_series):
+            """
+            Initializes the save worker.
+
+            Parameters
+            ----------
+            packet_man : PacketManager
+                Packet manager holding the series to save.
+            packet_series : [Str]
+                Series to save, captured on the GUI thread.
+            """
+            super(MonitorView.SaveWorker, self).__init__()
+            self.signals = MonitorView.SaveWorker.Signals()
+            self._packet_man = packet_man
+            self._packet_series = packet_series
+
+        def run(self):
+            """
+            Saves each series and signals when done.
+            """
+            try:
+                # Make the timestamped folder once, so every series from this
+                # save lands in the same one.
+                save_dir = self._packet_man.create_save_dir()
+                for packet_series in self._packet_series:
+                    self._packet_man.save_packet_series(packet_series, save_dir)
+            finally:
+                self.signals.finished.emit()
@@ -10,11 +10,14 @@ Description: Implements the PacketManager class, which collects, sorts, and
 manages serial data packets.
 """
 # Library Imports.
-from collections import OrderedDict
 import csv
+import logging
 import os.path
 import time
 
+# Module logger.
+logger = logging.getLogger(__name__)
+
 # Class Implementation.
 class PacketManager:
     """
@@ -24,9 +27,9 @@ class PacketManager:
 
     def __init__(self):
         # The packets collected over the course of the program lifetime. Packets
-        # are sorted by type, and then by capture time.
-        self._packets = OrderedDict()
-        self._packets["all"] = OrderedDict()
+        # are sorted by type, and then by capture time. Dicts keep insertion
+        # order, which is the capture order.
+        self._packets = {"all": {}}
 
     def insert_packet(self, packet_series, packet_name, packet_data):
         """
@@ -43,9 +46,36 @@ class PacketManager:
         """
         self._packets["all"][packet_name] = packet_data
         if packet_series not in self._packets:
-            self._packets[packet_series] = OrderedDict()
+            self._packets[packet_series] = {}
         self._packets[packet_series][packet_name] = packet_data
 
+    def insert_packets(self, packets):
+        """
+        Inserts a batch of packets into the packet manager. Packets are grouped
+        by series first, so each series is looked up and updated once per batch.
+
+        Parameters
+        ----------
+        packets : [Dict]
+            Packets generated by the PacketParser. The series, x_val, and y_val
+            fields are used as the packet type, name, and data respectively.
+        """
+        all_packets = self._packets["all"]
+        groups = {}
+        for packet in packets:
+            series = packet["series"]
+            group = groups.get(series)
+            if group is None:
+                group = groups[series] = {}
+            all_packets[packet["x_val"]] = packet["y_val"]
+            group[packet["x_val"]] = packet["y_val"]
+
+        for series, group in groups.items():
+            if series in self._packets:
+                self._packets[series].update(group)
+            else:
+                self._packets[series] = group
+
     def remove_packet(self, packet_series, packet_name):
         """
         Removes a packet of a specific type and name from the overall set and
@@ -75,15 +105,29 @@ class PacketManager:
 
         Returns
         -------
-        OrderedDict/None
-            Ordered dict of the series specified, or None if the packet_series
-            is invalid.
+        Dict/None
+            Insertion ordered dict of the series specified, or None if the
+            packet_series is invalid.
         """
         if packet_series in self._packets:
             return self._packets[packet_series]
         return None
 
-    def save_packet_series(self, packet_series):
+    def create_save_dir(self):
+        """
+        Creates a folder in output/ named after the latest timestamp.
+
+        Returns
+        -------
+        Str
+            Path of the folder.
+        """
+        curr_dir = os.getcwd()
+        new_dir = os.path.join(curr_dir, r"output/" + time.strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(new_dir, exist_ok=True)
+        return new_dir
+
+    def save_packet_series(self, packet_series, save_dir=None):
         """
         Saves the packet_series, if valid, into a CSV organized by order of
         insertion. The CSV has two columns: the packet_name and the packet_data.
@@ -94,19 +138,23 @@ class PacketManager:
         ----------
         packet_series : Str
             Series to save.
+        save_dir : Str/None
+            Folder to save into, so several series saved together share one
+            folder. If None, a new one is made with create_save_dir.
         """
-        curr_dir = os.getcwd()
-        new_dir = os.path.join(curr_dir, r"output/" + time.strftime("%Y%m%d-%H%M%S"))
-        if not os.path.exists(new_dir):
-            os.makedirs(new_dir)
+        new_dir = save_dir
+        if new_dir is None:
+            new_dir = self.create_save_dir()
 
         if packet_series in self._packets:
-            print("Writing:", self._packets[packet_series])
+            # Snapshot the series first, since it may be saved off of the GUI
+            # thread while packets are still being inserted.
+            rows = list(self._packets[packet_series].items())
+            logger.debug("Writing: %s", rows)
             with open(new_dir + "/" + packet_series + ".csv", "w") as file:
                 writer = csv.writer(file, delimiter=",", lineterminator="\n")
                 writer.writerow(["key", "value"])
-                for key, value in self._packets[packet_series].items():
-                    writer.writerow([key, value])
+                writer.writerows(rows)
 
     def get_all_packet_series(self):
         """
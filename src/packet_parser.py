@@ -13,8 +13,65 @@ and converts them into readable packets defined by a configuration.
    padding.
 """
 # Library Imports.
+import functools
+import logging
+import operator
 import re
 
+# Module logger.
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_alternation(strings):
+    """
+    Compiles a list of literal strings into a single regex alternation, so a
+    buffer can be scanned for all of them in one pass. Patterns are cached, so
+    reloading a configuration doesn't recompile them.
+
+    Parameters
+    ----------
+    strings : (Str)
+        Literal strings to match. Must be a tuple to be usable as a cache key.
+
+    Returns
+    -------
+    re.Pattern
+        Pattern matching any of the strings. Longer strings are tried first, so
+        when one string is a prefix of another (i.e. "=" and "==") the
+        longest match wins regardless of the order in the config.
+    """
+    return re.compile("|".join(map(re.escape, sorted(strings, key=len, reverse=True))))
+
+
+def _scrub_ignored_strings(packet, ignored_strings, ignore_table=None):
+    """
+    Scrubs a list of strings from a potential packet.
+
+    Parameters
+    ----------
+    packet : Str
+        Packet to scrub.
+    ignored_strings : (Str)
+        Strings to remove from the packet.
+    ignore_table : Dict/None
+        Optional str.translate table deleting every ignored string. Only valid
+        when all of the ignored strings are single characters.
+
+    Returns
+    -------
+    Str
+        The packet with ignored_strings scrubbed.
+    """
+    if ignore_table is not None:
+        return packet.translate(ignore_table)
+
+    # Multi-character strings are removed one after another, since removing one
+    # can expose another.
+    for entry in ignored_strings:
+        packet = packet.replace(entry, "")
+    return packet
+
 # Class Implementation.
 class PacketParser:
     """
@@ -39,10 +96,121 @@ class PacketParser:
         """
         self._packet_ID = 0
         self._packets = []
-        self._byte_stream = b""
+        self._byte_stream = bytearray()
         self._cleaned_byte_stream = None
         self._config = config
 
+        # Resolve the packet format and the expected number of subfields once
+        # instead of on every call to parse().
+        self._packet_format = None
+        self._num_data_delims = 0
+        self._packet_ids = frozenset()
+        self._ignored_strings = ()
+        if config is not None:
+            self._packet_format = config["packet_format"]
+            self._num_data_delims = (
+                len(self._packet_format.get("data_delimiters", [])) + 1
+            )
+
+            # Every parsed subpacket is checked against the packet ids, so keep
+            # them as a set instead of scanning the list each time.
+            self._packet_ids = frozenset(self._packet_format.get("packet_ids", []))
+            self._ignored_strings = tuple(self._packet_format.get("ignore", []))
+
+        # Ignored strings are usually single characters (i.e. "\r" or " "), in
+        # which case they can all be dropped in a single str.translate pass.
+        self._ignore_table = None
+        if self._ignored_strings and all(
+            len(entry) == 1 for entry in self._ignored_strings
+        ):
+            self._ignore_table = str.maketrans("", "", "".join(self._ignored_strings))
+
+        # Compile the delimiter alternations once per configuration.
+        self._packet_delims_re = None
+        self._data_delims_re = None
+        self._split_packet_stream = None
+        self._split_data_fields = None
+        if self._packet_format is not None and self._packet_format["type"] in [0, 1]:
+            self._packet_delims_re = _compile_alternation(
+                tuple(self._packet_format["packet_delimiters"])
+            )
+            self._data_delims_re = _compile_alternation(
+                tuple(self._packet_format["data_delimiters"])
+            )
+
+            # Usually there is a single packet delimiter (i.e. "\n"), which
+            # str.split handles more cheaply than the regex engine.
+            packet_delims = self._packet_format["packet_delimiters"]
+            self._split_packet_stream = self._packet_delims_re.split
+            if len(packet_delims) == 1 and packet_delims[0] != "":
+                self._split_packet_stream = operator.methodcaller(
+                    "split", packet_delims[0]
+                )
+
+            # Likewise for a single data delimiter (i.e. "=" or ":").
+            data_delims = self._packet_format["data_delimiters"]
+            split_data_fields = self._data_delims_re.split
+            if len(data_delims) == 1 and data_delims[0] != "":
+                split_data_fields = operator.methodcaller("split", data_delims[0])
+
+            # Type 0 packets are scrubbed of ignored strings before they are
+            # split, so do both in one step.
+            if self._packet_format["type"] == 0 and self._ignored_strings:
+                split_data_delims = split_data_fields
+                ignored_strings = self._ignored_strings
+                ignore_table = self._ignore_table
+
+                def split_data_fields(packet):
+                    return split_data_delims(
+                        _scrub_ignored_strings(packet, ignored_strings, ignore_table)
+                    )
+
+            # Steady state telemetry repeats the same packets often, so the
+            # data delimiter split is memoized by packet string. The cached
+            # lists are shared between calls and must not be mutated.
+            self._split_data_fields = functools.lru_cache(maxsize=1024)(
+                split_data_fields
+            )
+
+        # Type 0 packets with data delimiters are only emitted once a new
+        # delimiter arrives, so chunks without one can be buffered without
+        # rescanning the pending bytes. Keep a bytes pattern for all delimiters
+        # and its longest match, to look for them across chunk boundaries.
+        # This only holds if scrubbing ignored strings can't add or remove data
+        # delimiters (i.e. ignoring "=>" with "=" as a data delimiter), which is
+        # guaranteed when they are single characters absent from the ignores.
+        self._delims_scan_re = None
+        self._max_delim_len = 0
+        if (
+            self._packet_format is not None
+            and self._packet_format["type"] == 0
+            and self._num_data_delims > 1
+            and not any(
+                len(delim) != 1
+                or any(delim in entry for entry in self._ignored_strings)
+                for delim in self._packet_format["data_delimiters"]
+            )
+        ):
+            delims = tuple(
+                self._packet_format["packet_delimiters"]
+                + self._packet_format["data_delimiters"]
+            )
+            self._delims_scan_re = re.compile(
+                _compile_alternation(delims).pattern.encode("utf-8")
+            )
+            self._max_delim_len = max(len(delim.encode("utf-8")) for delim in delims)
+
+        # Bind the parsing routine for the packet type once, since the
+        # configuration doesn't change over the lifetime of the parser.
+        self._parse_fn = self._parse_default
+        if self._packet_format is not None:
+            self._parse_fn = {
+                0: self._parse_t0,
+                1: self._parse_t1,
+                2: self._parse_t2,
+                3: self._parse_t3,
+            }.get(self._packet_format["type"], self._parse_default)
+
     def parse(self, byte_stream):
         """
         Appends the byte_stream to the current set of bytes and updates the list
@@ -53,104 +221,114 @@ class PacketParser:
         byte_stream : ByteArray
             Bytes to translate into a packet.
         """
-        self._byte_stream += byte_stream
-        if self._config is not None:
-            packet_type = self._config["packet_format"]["type"]
-            if packet_type == 0:
-                # 1. Split the bytearray into packets using the packet_delimiter.
-                packets = self._split_bytes_into_packets(
-                    self._byte_stream,
-                    self._config["packet_format"]["packet_delimiters"],
-                )
-
-                # 2. Scrub ignored strings from all packets.
-                packets_scrubbed = self._scrub_ignored_strings(
-                    packets, self._config["packet_format"]["ignore"]
-                )
+        scan_start = max(0, len(self._byte_stream) - self._max_delim_len + 1)
+        self._byte_stream.extend(byte_stream)
+        if (
+            self._delims_scan_re is not None
+            and self._delims_scan_re.search(self._byte_stream, scan_start) is None
+        ):
+            return
+        self._parse_fn()
+
+    def _parse_t0(self):
+        """
+        Parses the current set of bytes as type 0 packets.
+        """
+        # 1. Split the bytearray into packets using the packet_delimiter.
+        packets = self._split_bytes_into_packets(
+            self._byte_stream, self._split_packet_stream
+        )
 
-                # 3. Attempt to split strings via data_delimiters.
-                packets_split = self._split_packets_by_data_delims(
-                    packets_scrubbed, self._config["packet_format"]["data_delimiters"]
-                )
+        # 2. Capture incomplete packets from the rear and
+        #    re-insert into the cleaned_byte_stream.
+        (
+            packets_complete,
+            self._byte_stream,
+        ) = self._capture_incomplete_packets_t0(
+            packets,
+            self._byte_stream,
+            self._num_data_delims,
+        )
 
-                # 4. Capture incomplete packets from the rear and
-                #    re-insert into the cleaned_byte_stream.
-                (
-                    packets_complete,
-                    self._byte_stream,
-                ) = self._capture_incomplete_packets_t0(
-                    packets_split,
-                    packets,
-                    self._byte_stream,
-                    len(self._config["packet_format"]["data_delimiters"]) + 1,
-                )
+        # 3. Scrub ignored strings from each packet, split it via
+        #    data_delimiters, and throw it out if it's invalid. This is done in
+        #    a single pass so no intermediate lists of packets are built, and
+        #    the scrub and split are memoized together by raw packet.
+        packets_valid = self._generate_valid_packets_t0(
+            packets_complete,
+            self._packet_ids,
+            self._num_data_delims,
+        )
 
-                # 5. Check the packets list. Throw out invalid packets.
-                packets_valid = self._generate_valid_packets_t0(
-                    packets_complete,
-                    self._config["packet_format"]["packet_ids"],
-                    len(self._config["packet_format"]["data_delimiters"]) + 1,
-                )
+        self._packets += packets_valid
 
-                self._packets += packets_valid
-                return
-            elif packet_type == 1:
-                # 1. Split the bytearray into packets using the packet_delimiter.
-                packets = self._split_bytes_into_packets(
-                    self._byte_stream,
-                    self._config["packet_format"]["packet_delimiters"],
-                )
+    def _parse_t1(self):
+        """
+        Parses the current set of bytes as type 1 packets.
+        """
+        # 1. Split the bytearray into packets using the packet_delimiter.
+        packets = self._split_bytes_into_packets(
+            self._byte_stream, self._split_packet_stream
+        )
 
-                # 2. Attempt to split strings via data_delimiters.
-                packets_split = self._split_packets_by_data_delims(
-                    packets,
-                    self._config["packet_format"]["data_delimiters"],
-                )
+        # 2. Attempt to split strings via data_delimiters.
+        packets_split = self._split_packets_by_data_delims(
+            packets, self._split_data_fields
+        )
 
-                # 3. Order packets by specifiers and trim if necessary.
-                packets_ordered = self._sort_packets_by_specifiers(
-                    packets_split,
-                    self._config["packet_format"]["specifiers"],
-                    len(self._config["packet_format"]["data_delimiters"]) + 1,
-                )
+        # 3. Order packets by specifiers and trim if necessary.
+        packets_ordered = self._sort_packets_by_specifiers(
+            packets_split,
+            self._packet_format["specifiers"],
+            self._num_data_delims,
+        )
 
-                # 4. Capture incomplete packets from the rear and
-                #    re-insert into the cleaned_byte_stream.
-                (
-                    packets_complete,
-                    self._byte_stream,
-                ) = self._capture_incomplete_packets_t1(
-                    packets_ordered,
-                    packets,
-                    self._byte_stream,
-                    len(self._config["packet_format"]["data_delimiters"]) + 1,
-                )
+        # 4. Capture incomplete packets from the rear and
+        #    re-insert into the cleaned_byte_stream.
+        (
+            packets_complete,
+            self._byte_stream,
+        ) = self._capture_incomplete_packets_t1(
+            packets_ordered,
+            packets,
+            self._byte_stream,
+            self._num_data_delims,
+        )
 
-                # 5. Check the packets list. Throw out invalid packets.
-                packets_valid = self._generate_valid_packets_t1(
-                    packets_complete,
-                    self._config["packet_format"]["packet_ids"],
-                    len(self._config["packet_format"]["data_delimiters"]) + 1,
-                )
+        # 5. Check the packets list. Throw out invalid packets.
+        packets_valid = self._generate_valid_packets_t1(
+            packets_complete,
+            self._packet_ids,
+            self._num_data_delims,
+        )
 
-                self._packets += packets_valid
-                return
-            elif packet_type == 2:
-                # TODO: Type 2 parsing using bytearray.
-                packets = self._split_bits_into_packets()
+        self._packets += packets_valid
 
-                print("\ntype 2 case unimplemented.")
+    def _parse_t2(self):
+        """
+        Parses the current set of bytes as type 2 packets.
+        """
+        # TODO: Type 2 parsing using bytearray. Until then, drop the pending
+        # bytes so they don't accumulate.
+        self._byte_stream = bytearray()
 
-                return
-            elif packet_type == 3:
-                # TODO: Type 3 parsing usingbitarray.
-                packets = self._split_bits_into_packets()
+        logger.debug("Type 2 case unimplemented.")
 
-                print("\ntype 3 case unimplemented.")
+    def _parse_t3(self):
+        """
+        Parses the current set of bytes as type 3 packets.
+        """
+        # TODO: Type 3 parsing usingbitarray. Until then, drop the pending bytes
+        # so they don't accumulate.
+        self._byte_stream = bytearray()
 
-                return
+        logger.debug("Type 3 case unimplemented.")
 
-        # Default case. Just capture the entire thing as a string.
+    def _parse_default(self):
+        """
+        Default case, used when there is no packet configuration. Just captures
+        the entire set of bytes as a string.
+        """
         self._packets.append(
             {
                 "text": self._byte_stream.decode("utf-8"),
@@ -161,7 +339,7 @@ class PacketParser:
         )
         self._byte_stream = bytearray()
 
-    def _split_bytes_into_packets(self, byte_stream, delims):
+    def _split_bytes_into_packets(self, byte_stream, split_packet_stream):
         """
         Splits the bytearray into different packets. Used by packet types 0, 1.
 
@@ -169,43 +347,19 @@ class PacketParser:
         ----------
         byte_stream : ByteArray
             An array of bytes to split into packets.
-        delims : [Str]
-            A list of delimiter strings to cut packets with.
+        split_packet_stream : Callable
+            Function splitting the decoded stream by the packet_delimiters.
 
         Returns
         -------
         [Str]
             A list of packets split by either delimiter or length definition.
         """
-        delims_exp = "|".join(map(re.escape, delims))
         str_stream = byte_stream.decode("utf8")
-        packets = re.split(delims_exp, str_stream)
+        packets = split_packet_stream(str_stream)
         return packets
 
-    def _scrub_ignored_strings(self, packets, ignored_strings):
-        """
-        Scrubs a list of strings from a list of potential packets.
-
-        Parameters
-        ----------
-        packets : [Str]
-            A list of packets to scrub.
-        ignored_strings : [Str]
-            A list of strings to remove from packets.
-
-        Returns
-        -------
-        [Str]
-            A list of packets with ignored_strings scrubbed.
-        """
-        str_list_scrub = []
-        for packet in packets:
-            for entry in ignored_strings:
-                packet = packet.replace(entry, "")
-            str_list_scrub.append(packet)
-        return str_list_scrub
-
-    def _split_packets_by_data_delims(self, packets, data_delimiters):
+    def _split_packets_by_data_delims(self, packets, split_data_fields):
         """
         Splits a list of packets into subpackets using data_delimiters.
 
@@ -213,20 +367,15 @@ class PacketParser:
         ----------
         packets : [Str]
             A list of packets to split into subpackets.
-        data_delimiters : [Str]
-            A list of strings to split each packet in packets with.
+        split_data_fields : Callable
+            Function splitting a single packet by the data_delimiters.
 
         Returns
         -------
         [[Str, Str], ...]
             A list of lists split by data_delimiters.
         """
-        str_list_split = []
-        for packet in packets:
-            delims_exp = "|".join(map(re.escape, data_delimiters))
-            str_split = re.split(delims_exp, packet)
-            str_list_split.append(str_split)
-        return str_list_split
+        return [split_data_fields(packet) for packet in packets]
 
     def _sort_packets_by_specifiers(self, packets, specifiers, num_data_delims):
         """
@@ -264,16 +413,19 @@ class PacketParser:
         #   fail, save the packets state, and retry.
 
         # Remove remnant of packet splitting.
+        num_packets = len(packets)
         if packets[-1] == [""]:
-            packets = packets[:-1]
+            num_packets -= 1
 
-        # Organize the packets as a stack and build a usable set of packets.
+        # Walk the packets with an index rather than popping them off the front
+        # of the list, which would shift the remaining packets every time.
+        # "Putting a packet back" is just advancing past the first candidate.
         new_packets = []
-        while len(packets) > 0:
-            # Using packets like a stack:
-            packet_id_candidate = packets.pop(0)
-            if len(packets) > 0:
-                packet_data_candidate = packets.pop(0)
+        idx = 0
+        while idx < num_packets:
+            packet_id_candidate = packets[idx]
+            if idx + 1 < num_packets:
+                packet_data_candidate = packets[idx + 1]
 
                 # Now that we have two candidates, we look at the two
                 # candidates.
@@ -298,67 +450,72 @@ class PacketParser:
 
                 if bad_ID and bad_DATA:
                     # GARBAGE:GARBAGE or DATA:ID; throw the first packet out and
-                    # put the second back onto the stack.
-                    packets.insert(0, packet_data_candidate)
+                    # look at the second again.
+                    idx += 1
                 elif bad_ID and not bad_DATA:
                     # GARBAGE:DATA or DATA:DATA; throw both packets out.
-                    pass
+                    idx += 2
                 elif not bad_ID and bad_DATA:
-                    # ID:GARBAGE or ID:ID; throw first packet out and put the
-                    # second back onto the stack.
-                    packets.insert(0, packet_data_candidate)
+                    # ID:GARBAGE or ID:ID; throw first packet out and look at
+                    # the second again.
+                    idx += 1
                 else:
                     # ID: DATA; keep both packets and put into our new list.
                     new_packets.append(packet_id_candidate)
                     new_packets.append(packet_data_candidate)
+                    idx += 2
             else:
                 # Only one candidate to look at. Append it for the next round.
                 new_packets.append(packet_id_candidate)
+                idx += 1
 
         return new_packets
 
-    def _capture_incomplete_packets_t0(
-        self, packets, packets_full, byte_stream, num_data_delims
-    ):
+    def _capture_incomplete_packets_t0(self, packets, byte_stream, num_data_delims):
         """
         Identifies incomplete packets (Typically the last one), and re-inserts
         their bytes back into the cleaned_byte_stream for a later iteration.
 
         Parameters
         ----------
-        packets : [[Str, Str], ...]
-            A list of subpackets to check.
-        packets_full : [Str]
+        packets : [Str]
             A list of packets without string scrubbing.
         byte_stream : ByteArray
             An array of bytes to search for the position of the incomplete
-            subpacket.
+            packet.
+            Consumed bytes are removed from it in place.
         num_data_delims : int
             The number of expected subfields for each packet.
 
         Returns
         -------
-        ([[Str, Str], ...], ByteArray)
-            The list of subpackets, and the cleaned byte array containing only
-            incomplete packets.
+        ([Str], ByteArray)
+            The list of complete packets, and the cleaned byte array containing
+            only incomplete packets.
         """
-        if len(packets[-1]) != num_data_delims:
-            return (
-                packets[:-1],
-                byte_stream[len(byte_stream) - len(packets_full[-1]) :],
-            )
+        # Only the last packet can be incomplete, so only it is scrubbed and
+        # split here. The packets are decoded text, so measure the tail in
+        # encoded bytes to avoid cutting a multi-byte character in half. The
+        # consumed bytes are deleted in place, which a bytearray does without
+        # copying the tail.
+        last_packet = self._split_data_fields(packets[-1])
+        if len(last_packet) != num_data_delims:
+            tail_len = len(packets[-1].encode("utf-8"))
+            del byte_stream[: len(byte_stream) - tail_len]
+            return (packets[:-1], byte_stream)
         return (packets, bytearray())
 
     def _generate_valid_packets_t0(self, packets, packet_ids, num_data_delims):
         """
-        Generates valid packet information for t0 packet configuration.
+        Generates valid packet information for t0 packet configuration. Each
+        packet is scrubbed and split via data_delimiters as it is checked.
 
         Parameters
         ----------
-        packets : [[Str, Str], ...]
-            A list of subpackets to convert into valid packet formats.
-        packet_ids: [Str]
-            A list of relevant packet IDs to capture.
+        packets : [Str]
+            A list of packets to convert into valid packet formats.
+        packet_ids: FrozenSet
+            The set of relevant packet IDs to capture.
         num_data_delims : int
             The number of expected subfields for each packet.
 
@@ -372,8 +529,10 @@ class PacketParser:
         }, ...]
             A list of packet metadata for retrieval.
         """
+        split_data_fields = self._split_data_fields
         valid_packets = []
         for packet in packets:
+            packet = split_data_fields(packet)
             if len(packet) == num_data_delims:
                 if packet[0] in packet_ids and packet[1] != "":
                     valid_packets.append(
@@ -405,6 +564,7 @@ class PacketParser:
         byte_stream : ByteArray
             An array of bytes to search for the position of the incomplete
             subpacket.
+            Consumed bytes are removed from it in place.
         num_data_delims : int
             The number of expected subfields for each packet.
 
@@ -419,11 +579,13 @@ class PacketParser:
         if packets_full[-1] == "":
             comparison_list = packets_full[:-1]
 
+        # The packets are decoded text, so measure the tail in encoded bytes to
+        # avoid cutting a multi-byte character in half. The consumed bytes are
+        # deleted in place, which a bytearray does without copying the tail.
         if len(packets) % 2:
-            return (
-                packets[:-1],
-                byte_stream[len(byte_stream) - len(comparison_list[-1]) - 1 :],
-            )
+            tail_len = len(comparison_list[-1].encode("utf-8")) + 1
+            del byte_stream[: len(byte_stream) - tail_len]
+            return (packets[:-1], byte_stream)
         return (packets, bytearray())
 
     def _generate_valid_packets_t1(self, packets, packet_ids, num_data_delims):
@@ -434,8 +596,8 @@ class PacketParser:
         ----------
         packets : [[Str, Str], ...]
             A list of subpackets to convert into valid packet formats.
-        packet_ids: [Str]
-            A list of relevant packet IDs to capture.
+        packet_ids: FrozenSet
+            The set of relevant packet IDs to capture.
         num_data_delims : int
             The number of expected subfields for each packet.
 
@@ -9,13 +9,16 @@ Last Modified: 05/21/21
 Description: Implements the SetupView class, which inherits DisplayView class.
 """
 # Library Imports.
-import json
+import logging
 from PyQt5.QtCore import Qt, QDir
 from PyQt5.QtWidgets import QFileDialog
 
 # Custom Imports.
 from src.display_view import DisplayView
-from src.misc import capture_port_names
+from src.misc import capture_port_names, load_json_file
+
+# Module logger.
+logger = logging.getLogger(__name__)
 
 # Class Implementation.
 class SetupView(DisplayView):
@@ -47,21 +50,28 @@ class SetupView(DisplayView):
 
         self._serial_datastream = self._controller.get_data_pointer("serial_datastream")
 
+        # Bind the widgets we touch to attributes once, instead of looking them up
+        # on every frame.
+        self._cb_baud = self._widget_pointers["cb_baud"]
+        self._cb_databits = self._widget_pointers["cb_databits"]
+        self._cb_endian = self._widget_pointers["cb_endian"]
+        self._cb_paritybits = self._widget_pointers["cb_paritybits"]
+        self._cb_portname = self._widget_pointers["cb_portname"]
+        self._cb_syncbits = self._widget_pointers["cb_syncbits"]
+        self._bu_connect = self._widget_pointers["bu_connect"]
+        self._le_serial_config = self._widget_pointers["le_serial_config"]
+
         # Set Status to DISCONNECTED.
-        self._widget_pointers["lbl_status"].setAutoFillBackground(True)
-        self._widget_pointers["lbl_status"].setText(
-            self._controller.get_data_pointer("status")
-        )
+        self._lbl_status.setText(self._controller.get_data_pointer("status"))
 
         # Set labels to default values.
-        self._widget_pointers["cb_baud"].addItems([str(x) for x in SetupView.BAUD_RATE])
-        self._widget_pointers["cb_databits"].addItems(SetupView.DATA_BITS)
-        self._widget_pointers["cb_endian"].addItems(SetupView.ENDIAN)
-        self._widget_pointers["cb_paritybits"].addItems(SetupView.PARITY_BITS)
-        self._widget_pointers["cb_portname"].addItems(
-            self._controller.get_data_pointer("port_names")
-        )
-        self._widget_pointers["cb_syncbits"].addItems(SetupView.SYNC_BITS)
+        self._cb_baud.addItems([str(x) for x in SetupView.BAUD_RATE])
+        self._cb_databits.addItems(SetupView.DATA_BITS)
+        self._cb_endian.addItems(SetupView.ENDIAN)
+        self._cb_paritybits.addItems(SetupView.PARITY_BITS)
+        self._port_names = self._controller.get_data_pointer("port_names")
+        self._cb_portname.addItems(self._port_names)
+        self._cb_syncbits.addItems(SetupView.SYNC_BITS)
 
         # Setup file configuration button.
         self._widget_pointers["bu_serial_config_filesearch"].clicked.connect(
@@ -69,30 +79,36 @@ class SetupView(DisplayView):
         )
 
         # Setup connect button.
-        self._widget_pointers["bu_connect"].clicked.connect(self._connect_disconnect)
-        self._widget_pointers["lbl_status"].setStyleSheet(
-            "QLabel { background-color: rgba(122, 122, 122, 255); }"
-        )
+        self._bu_connect.clicked.connect(self._connect_disconnect)
+        self._set_status_color(SetupView.GRAY)
+
+        # Frames left to wait for the serial worker to report READY, while a
+        # connection is pending.
+        self._connect_frames_left = 0
 
         self.init_frame(self._update_console)
 
     def _update_console(self):
+        if self._connect_frames_left:
+            self._check_connection()
+
         self._update_ports()
 
         status = self._controller.get_data_pointer("status")
         if status == "DISCONNECTED":
-            self._widget_pointers["bu_connect"].setText("Connect")
+            self._bu_connect.setText("Connect")
         elif status == "CONNECTED":
-            self._widget_pointers["bu_connect"].setText("Disconnect")
+            self._bu_connect.setText("Disconnect")
 
     def _update_ports(self):
         """
-        Updates the list of active ports.
+        Updates the list of active ports, if it has changed.
         """
-        self._widget_pointers["cb_portname"].clear()
-        self._widget_pointers["cb_portname"].addItems(
-            self._controller.get_data_pointer("port_names")
-        )
+        port_names = self._controller.get_data_pointer("port_names")
+        if port_names != self._port_names:
+            self._port_names = port_names
+            self._cb_portname.clear()
+            self._cb_portname.addItems(port_names)
 
     def get_file_name(self):
         """
@@ -104,31 +120,29 @@ class SetupView(DisplayView):
 
         if dialog.exec_():
             file_name = dialog.selectedFiles()
-            self._widget_pointers["le_serial_config"].setText(file_name[0])
+            self._le_serial_config.setText(file_name[0])
 
             # File validation.
             if file_name[0].endswith(".json"):
-                with open(file_name[0], "r") as f:
-                    data = json.load(f)
+                data = load_json_file(file_name[0])
 
-                    if "port_name" in data and type(data["port_name"]) is str:
-                        self._get_file_name_helper(data, "cb_portname", "port_name")
+                if "port_name" in data and type(data["port_name"]) is str:
+                    self._get_file_name_helper(data, "cb_portname", "port_name")
 
-                    if "baud_rate" in data and type(data["baud_rate"]) is int:
-                        self._get_file_name_helper(data, "cb_baud", "baud_rate")
+                if "baud_rate" in data and type(data["baud_rate"]) is int:
+                    self._get_file_name_helper(data, "cb_baud", "baud_rate")
 
-                    if "data_bits" in data and type(data["data_bits"]) is str:
-                        self._get_file_name_helper(data, "cb_databits", "data_bits")
+                if "data_bits" in data and type(data["data_bits"]) is str:
+                    self._get_file_name_helper(data, "cb_databits", "data_bits")
 
-                    if "endian" in data and type(data["endian"]) is str:
-                        self._get_file_name_helper(data, "cb_endian", "endian")
+                if "endian" in data and type(data["endian"]) is str:
+                    self._get_file_name_helper(data, "cb_endian", "endian")
 
-                    if "sync_bits" in data and type(data["sync_bits"]) is str:
-                        self._get_file_name_helper(data, "cb_syncbits", "sync_bits")
+                if "sync_bits" in data and type(data["sync_bits"]) is str:
+                    self._get_file_name_helper(data, "cb_syncbits", "sync_bits")
 
-                    if "parity_bits" in data and type(data["parity_bits"]) is str:
-                        self._get_file_name_helper(data, "cb_paritybits", "parity_bits")
-                    f.close()
+                if "parity_bits" in data and type(data["parity_bits"]) is str:
+                    self._get_file_name_helper(data, "cb_paritybits", "parity_bits")
             else:
                 self.raise_error("Invalid file type.")
 
@@ -171,12 +185,12 @@ class SetupView(DisplayView):
         """
         Validates the existing inputs and attempts to connect to the serial device.
         """
-        port = self._widget_pointers["cb_portname"].currentText()
-        baud_rate = self._widget_pointers["cb_baud"].currentText()
-        data_bits = self._widget_pointers["cb_databits"].currentText()
-        endianness = self._widget_pointers["cb_endian"].currentText()
-        parity_bits = self._widget_pointers["cb_paritybits"].currentText()
-        sync_bits = self._widget_pointers["cb_syncbits"].currentText()
+        port = self._cb_portname.currentText()
+        baud_rate = self._cb_baud.currentText()
+        data_bits = self._cb_databits.currentText()
+        endianness = self._cb_endian.currentText()
+        parity_bits = self._cb_paritybits.currentText()
+        sync_bits = self._cb_syncbits.currentText()
 
         if self._validate_config(
             port, baud_rate, data_bits, endianness, parity_bits, sync_bits
@@ -192,40 +206,64 @@ class SetupView(DisplayView):
             config["parity_bits"] = str(parity_bits)
 
             # Set status box to "CONNECTING" and set to blue.
-            self._widget_pointers["lbl_status"].setText("CONNECTING")
-            self._widget_pointers["lbl_status"].setStyleSheet(
-                "QLabel { background-color: rgba(122, 122, 255, 255); }"
-            )
+            self.raise_status("CONNECTING", SetupView.LIGHT_BLUE)
+            self._controller.set_data_pointer("status", "CONNECTING")
 
-            # Activate a serial connection.
+            # Activate a serial connection. The result is checked once per frame
+            # by _check_connection, so the UI keeps running while we wait.
+            self._bu_connect.setEnabled(False)
+            self._connect_frames_left = 5 * self._framerate
             self._controller.start_serial_thread()
 
-            # Check for status == READY by the serialWorker in serial_datastream.
-            ready = False
-            timeout = 0
-
-            _status_lock = self._serial_datastream["status_lock"]
-            while not ready:
-                print("Looping..")
-                while not _status_lock.tryLock(SetupView.SECOND / self._framerate):
-                    timeout += 1
-
-                _status_buffer = self._serial_datastream["status"]
-                if len(_status_buffer) != 0 and _status_buffer[0] == "READY":
-                    self._serial_datastream["status"] = _status_buffer[1:]
-                    ready = True
-                _status_lock.unlock()
-
-                # If we haven't connected after 5 seconds, time out.
-                if timeout >= SetupView.SECOND * 5 / self._framerate:
-                    print("timeout!")
-                    self.disconnect()
-                    self.raise_error("TIMEOUT")
-                    return
-
+    def _check_connection(self):
+        """
+        Checks whether the serial worker has opened the pending connection. The
+        first status the worker reports decides the outcome: READY connects, and
+        anything else is raised as an error. If the worker reports nothing
+        within 5 seconds, the connection times out.
+        """
+        _status_lock = self._serial_datastream["status_lock"]
+        _status_lock.lock()
+        try:
+            _status_buffer = self._serial_datastream["status"]
+            status = _status_buffer[0] if _status_buffer else None
+            # Errors are left in the FIFO for the MonitorView to log.
+            if status == "READY":
+                self._serial_datastream["status"] = _status_buffer[1:]
+        finally:
+            _status_lock.unlock()
+
+        if status is None:
+            # The worker gives up by marking itself disconnected. If it did so
+            # without a status left for us, the MonitorView already took and
+            # raised the error.
+            if self._controller.get_data_pointer("status") == "DISCONNECTED":
+                self._connect_frames_left = 0
+                self._bu_connect.setEnabled(True)
+                if not self._revert_timer.isActive():
+                    self.raise_status("DISCONNECTED", SetupView.LIGHT_BLUE)
+                return
+
+            # Otherwise keep waiting, and if we haven't connected after 5
+            # seconds, time out.
+            self._connect_frames_left -= 1
+            if not self._connect_frames_left:
+                logger.debug("Serial connection timed out.")
+                self._bu_connect.setEnabled(True)
+                self.disconnect()
+                self.raise_error("TIMEOUT")
+            return
+
+        self._connect_frames_left = 0
+        self._bu_connect.setEnabled(True)
+        if status == "READY":
             # Upon success, set status to connected.
             self._controller.set_data_pointer("status", "CONNECTED")
-            self.raise_status("CONNECTED", "rgba(0, 255, 0, 255)")
+            self.raise_status("CONNECTED", SetupView.GREEN)
+        else:
+            logger.debug("Serial connection failed: %s", status)
+            self.disconnect()
+            self.raise_error(status)
 
     def _validate_config(
         self, port, baud_rate, data_bits, endianness, parity_bits, sync_bits
@@ -299,4 +337,4 @@ class SetupView(DisplayView):
 
         # Upon success, set status to disconnected.
         self._controller.set_data_pointer("status", "DISCONNECTED")
-        self.raise_status("DISCONNECTED", "rgba(122, 122, 255, 255)")
+        self.raise_status("DISCONNECTED", SetupView.LIGHT_BLUE)